@@ -1,15 +1,54 @@
-import requests
-
+import functools
 import logging
-from contextlib import contextmanager
-
-import docker
+import os
+import socket
+import threading
+import time
+from multiprocessing.pool import ThreadPool
 
-from hypervisor_base import HypervisorBase
+from .hypervisor_base import HypervisorBase
 import errors
 
 logger = logging.getLogger(__name__)
 
+# container state implied by each docker container event
+_EVENT_STATUS = {
+    'create': 'created',
+    'start': 'running',
+    'restart': 'running',
+    'unpause': 'running',
+    'pause': 'paused',
+    'die': 'exited',
+}
+
+def _map_errors(nfioError):
+    """
+    @brief convert docker-py exceptions to nfio exceptions
+
+    This decorator is used to catch docker-py exceptions (from error.py), 
+    log them, and then raise nfio related exceptions. The original 
+    exception is kept as the nfio exception's __cause__. nfio exceptions 
+    raised by the decorated method are passed through unchanged.
+
+    @param nfioError A Exception type from nfio's errors module 
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except errors.nfioError:
+                raise
+            except Exception as ex:
+                logger.error("%s", ex,
+                    exc_info=logger.isEnabledFor(logging.DEBUG))
+                error = nfioError()
+                # equivalent to 'raise error from ex' on Python 3
+                error.__cause__ = ex
+                raise error
+        return wrapper
+    return decorator
+
 class DockerDriver(HypervisorBase):
     """
     @class DockerDriver
@@ -26,66 +65,89 @@ class DockerDriver(HypervisorBase):
             the docker-py remote API client. 
 
         @property __port is the port number used for remote API invocation.
-        @property __version is the version number for the report API.
+        @property __local_socket is the path of the docker daemon's unix 
+            socket, used instead of TCP when the host is the local machine.
+        @property __version is the version number for the report API. 
+            'auto' negotiates the daemon's version once per client.
         @property __dns_list is the list of DNS server(s) used by each container.
+        @property __pool_size is the number of pooled HTTP connections kept 
+            per docker host, over TCP or the local unix socket.
+        @property __clients maps a host to its long-lived docker client.
+        @property __client_locks maps a host to the lock held while its 
+            client is created, so that a slow host does not hold up others.
+        @property __inspect_ttl is the number of seconds a container's 
+            inspect data is reused before querying the daemon again.
+        @property __inspect_cache maps (host, container name) to a 
+            (timestamp, inspect data) tuple.
+        @property __live_states maps (host, container name) to a 
+            (state, change number) tuple taken from the host's event stream. 
+            Entries exist only while that stream is being followed.
+        @property __changes counts the container events applied and the 
+            state-changing operations issued by the driver. Data fetched 
+            while it moved is not cached.
+        @property __event_threads maps a host to the thread following its 
+            docker event stream.
+        @property __events_timeout is the read timeout in seconds of an 
+            event stream. A stream that stays silent longer is reopened.
+        @property __events_backoff is the number of seconds to wait before 
+            subscribing again to a host whose event stream failed.
+        @property __events_retry maps a host to the time before which its 
+            event stream is not subscribed again.
+        @property __max_workers is the maximum number of threads used by 
+            the *_many batch operations.
         """
         self.__port = '4444'
-        self.__version = '1.15'
+        self.__local_socket = '/var/run/docker.sock'
+        self.__version = 'auto'
         self.__dns_list = ['8.8.8.8']
-
-    @contextmanager
-    def _error_handling(self, nfioError):
-        """
-        @beief convert docker-py exceptions to nfio exceptions
-        
-        This code block is used to catch docker-py docker-py exceptions 
-        (from error.py), log them, and then raise nfio related 
-        exceptions. 
-
-        @param nfioError A Exception type from nfio's errors module 
-        """
-        try:
-            yield
-        except Exception, ex:
-            logger.error(ex.message, exc_info=False)
-            raise nfioError
-
-    def _is_empty(self, string):
-        """
-        @brief checks whether a string is empty or None
-    
-        @param string input string
-      
-        @returns True if string is empty, otherwise False
-        """
-        return string is None or string.strip() == ""
+        self.__pool_size = 32
+        self.__clients = {}
+        self.__clients_lock = threading.Lock()
+        self.__client_locks = {}
+        self.__events_lock = threading.Lock()
+        self.__inspect_ttl = 1.0
+        self.__inspect_cache = {}
+        self.__live_states = {}
+        self.__changes = 0
+        self.__live_lock = threading.Lock()
+        self.__event_threads = {}
+        self.__events_timeout = 30
+        self.__events_backoff = 30
+        self.__events_retry = {}
+        self.__max_workers = 16
 
     def _validate_host(self, host):
-        if self._is_empty(host):
+        if not (host and host.strip()):
             raise errors.VNFHostNameIsEmptyError
 
     def _validate_image_name(self, image_name):
-        if self._is_empty(image_name):
+        if not (image_name and image_name.strip()):
             raise errors.VNFImageNameIsEmptyError
 
     def _validate_cont_name(self, cont_name):
-        if self._is_empty(cont_name):
+        if not (cont_name and cont_name.strip()):
             raise errors.VNFNameIsEmptyError
-        ## check to see if there is any container with name cont_name
-        #nameExists = False
-        #dcx = self._get_client(host)
-        #containers = dcx.containers()
-        #for container in containers:
-        #    for cont_name in container['Names']:
-        #        # docker container names includes a leading '/'!
-        #        if vnf_fullname == cont_name[1:].encode('ascii'):
-        #            nameExists = True
-        #if not nameExist:
-        #    raise errors.VNFNotFoundError
 
+    def _base_url(self, host):
+        """
+        @brief returns the docker remote API URL of a host
+
+        The daemon's unix socket is used for the local machine, which 
+        avoids the TCP stack altogether.
+        """
+        if (host in ('127.0.0.1', 'localhost', socket.gethostname()) and 
+                os.path.exists(self.__local_socket)):
+            return "unix://" + self.__local_socket
+        return "http://" + host + ":" + self.__port
+
+    @_map_errors(errors.HypervisorConnectionError)
     def _get_client(self, host):
         """
         Returns a Docker client.
+
+        Clients are created once per host and reused afterwards, so that 
+        consecutive API calls share the same pool of keep-alive connections 
+        instead of paying a TCP setup per call.
         
         @param host IP address or hostname of the host (physical/virtual) 
             where docker containers will be deployed
@@ -93,23 +155,244 @@ class DockerDriver(HypervisorBase):
         @return A docker client object that can be used to communicate 
             with the docker daemon on the host
         """
-        self._validate_host(host)
-        with self._error_handling(errors.HypervisorConnectionError):
-          return docker.Client(
-            base_url="http://" +
-            host +
-            ":" +
-            self.__port,
-            version=self.__version)
+        dcx = self.__clients.get(host)
+        if dcx is not None:
+            return dcx
+        with self.__clients_lock:
+            host_lock = self.__client_locks.setdefault(host, threading.Lock())
+        # creating a client talks to the daemon (API version negotiation), 
+        # so only callers for the same host wait for it
+        with host_lock:
+            dcx = self.__clients.get(host)
+            if dcx is None:
+                # docker-py pulls in a large import graph, so it is only 
+                # loaded once a client is actually needed.
+                import docker
+                from requests.adapters import HTTPAdapter
+                base_url = self._base_url(host)
+                dcx = docker.Client(
+                    base_url=base_url,
+                    version=self.__version)
+                if base_url.startswith('unix://'):
+                    # docker-py's own unix socket adapter keeps a single 
+                    # connection, so it is replaced by a sized pool as well.
+                    from .docker_unixconn import mount_pooled_unix_adapter
+                    mount_pooled_unix_adapter(
+                        dcx, self.__local_socket, self.__pool_size)
+                else:
+                    # requests keeps only a handful of connections per host 
+                    # by default, which serializes concurrent API calls.
+                    adapter = HTTPAdapter(
+                        pool_connections=self.__pool_size,
+                        pool_maxsize=self.__pool_size,
+                        max_retries=0,
+                        pool_block=False)
+                    dcx.mount('http://', adapter)
+                    dcx.mount('https://', adapter)
+                dcx.headers['Connection'] = 'keep-alive'
+                self.__clients[host] = dcx
+            return dcx
 
     def _lookup_vnf(self, host, user, vnf_name):
         self._validate_host(host)
-        vnf_fullname = user + '-' + vnf_name
+        vnf_fullname = '%s-%s' % (user, vnf_name)
         self._validate_cont_name(vnf_fullname)
+        dcx, inspect_data = self._lookup_vnf_fast(host, vnf_fullname)
+        return dcx, vnf_fullname, inspect_data
+
+    @_map_errors(errors.VNFNotFoundError)
+    def _lookup_vnf_fast(self, host, vnf_fullname, refresh=False):
+        """
+        @brief returns the client and inspect data of an already validated 
+            container name
+
+        @param refresh if True then the inspect cache is bypassed
+        """
         dcx = self._get_client(host)
-        with self._error_handling(errors.VNFNotFoundError):
-            inspect_data = dcx.inspect_container(container=vnf_fullname)
-            return dcx, vnf_fullname, inspect_data
+        cached = self.__inspect_cache.get((host, vnf_fullname))
+        if (not refresh and cached is not None and 
+                time.time() - cached[0] < self.__inspect_ttl):
+            return dcx, cached[1]
+        changes = self.__changes
+        inspect_data = dcx.inspect_container(container=vnf_fullname)
+        self._cache_inspect(host, vnf_fullname, inspect_data, changes)
+        return dcx, inspect_data
+
+    def _cache_inspect(self, host, vnf_fullname, inspect_data, changes):
+        """
+        @brief caches inspect data fetched from the daemon, unless an event 
+            or a driver operation may have made it stale while it was being 
+            fetched
+
+        @param changes the value of __changes before the fetch
+        """
+        with self.__live_lock:
+            if self.__changes == changes:
+                self.__inspect_cache[(host, vnf_fullname)] = (
+                    time.time(), inspect_data)
+
+    def _ensure_running(self, inspect_data):
+        """
+        @brief raises VNFNotRunningError unless the inspected container 
+            is running
+        """
+        if inspect_data['State']['Status'] != 'running':
+            raise errors.VNFNotRunningError
+
+    def _invalidate(self, host, vnf_fullname, changes):
+        """
+        @brief drops the cached data of a container
+
+        Must be called after any operation that changes a container's state. 
+        A live state set by an event that arrived during the operation 
+        already reflects it and is kept. Otherwise the operation's event is 
+        still on its way and the state is read from the daemon until then.
+
+        @param changes the value of __changes before the operation
+        """
+        key = (host, vnf_fullname)
+        with self.__live_lock:
+            self.__inspect_cache.pop(key, None)
+            self.__changes += 1
+            live = self.__live_states.get(key)
+            if live is not None and live[1] <= changes:
+                del self.__live_states[key]
+
+    def _watch_events(self, host):
+        """
+        @brief starts following the docker event stream of a host, unless 
+            it is already being followed or recently failed
+        """
+        if (host in self.__event_threads or 
+                time.time() < self.__events_retry.get(host, 0)):
+            return
+        with self.__events_lock:
+            if (host not in self.__event_threads and 
+                    time.time() >= self.__events_retry.get(host, 0)):
+                thread = threading.Thread(
+                    target=self._follow_events, args=(host,))
+                thread.daemon = True
+                self.__event_threads[host] = thread
+                thread.start()
+
+    def _follow_events(self, host):
+        """
+        @brief keeps the cached state of a host's containers up to date from 
+            the docker event stream until the stream ends
+
+        Only a read timeout reopens the stream. Any other error, or a stream 
+        that ends, stops the subscription until the backoff expires.
+        """
+        try:
+            import docker
+            from requests.exceptions import ConnectionError, Timeout
+            try:
+                from requests.packages.urllib3.exceptions import ReadTimeoutError
+            except ImportError:
+                from urllib3.exceptions import ReadTimeoutError
+            read_timeouts = (
+                ConnectionError, Timeout, ReadTimeoutError, socket.timeout)
+            # the stream stays open indefinitely, so it gets its own client. 
+            # The read timeout makes a stalled connection fail instead of 
+            # blocking forever.
+            dcx = docker.Client(
+                base_url=self._base_url(host),
+                version=self.__version,
+                timeout=self.__events_timeout)
+            since = None
+            while True:
+                # opening the stream fails if the daemon is unreachable, 
+                # which ends the subscription
+                opened = time.time()
+                events = iter(dcx.events(since=since, decode=True,
+                    filters={'type': 'container'}))
+                while True:
+                    try:
+                        event = next(events)
+                    except StopIteration:
+                        logger.warning("docker event stream of %s ended", host)
+                        return
+                    except read_timeouts:
+                        # a stream that fails before it could have timed out 
+                        # is broken rather than idle
+                        if time.time() - opened < self.__events_timeout:
+                            raise
+                        # the stream was idle or stalled for too long. Reopen 
+                        # it and replay the events missed in the meantime.
+                        break
+                    since = event.get('time', since)
+                    self._apply_event(host, event)
+        except Exception as ex:
+            logger.warning("docker event stream of %s failed: %s", host, ex,
+                exc_info=logger.isEnabledFor(logging.DEBUG))
+        finally:
+            with self.__events_lock:
+                self.__event_threads.pop(host, None)
+                self.__events_retry[host] = time.time() + self.__events_backoff
+            # without the stream the live states can no longer be trusted
+            with self.__live_lock:
+                for key in list(self.__live_states):
+                    if key[0] == host:
+                        del self.__live_states[key]
+
+    def _apply_event(self, host, event):
+        """
+        @brief updates the cached state of a container from a docker event
+        """
+        action = event.get('Action') or event.get('status')
+        name = ((event.get('Actor') or {}).get('Attributes') or {}).get('name')
+        if not name:
+            return
+        status = _EVENT_STATUS.get(action)
+        if status is None and action != 'destroy':
+            return
+        key = (host, name)
+        with self.__live_lock:
+            # a state change may also change the rest of the inspect data 
+            # (e.g. the IP address), so it is fetched again on the next lookup
+            self.__inspect_cache.pop(key, None)
+            self.__changes += 1
+            if status is None:
+                self.__live_states.pop(key, None)
+            else:
+                self.__live_states[key] = (status, self.__changes)
+
+    @_map_errors(errors.HypervisorConnectionError)
+    def refresh_host(self, host):
+        """
+        Refreshes the cached state of all containers on a host.
+
+        A single container listing is used to fill the inspect cache with the 
+        ID, status, image and (when the daemon reports it) IP address of each 
+        container. Callers that query many VNFs on the same host should call 
+        this first to avoid one inspect request per VNF.
+
+        @param host IP address or hostname of the machine where
+            the docker containers are deployed
+        """
+        self._validate_host(host)
+        dcx = self._get_client(host)
+        changes = self.__changes
+        containers = dcx.containers(all=True)
+        for container in containers:
+            # older API versions do not report the state in the listing
+            state = container.get('State')
+            if not state:
+                continue
+            inspect_data = {
+                'Id': container['Id'],
+                'Config': {'Image': container.get('Image')},
+                'State': {'Status': state}}
+            networks = (container.get('NetworkSettings') or {}).get('Networks')
+            if networks:
+                network = networks.get('bridge') or list(networks.values())[0]
+                inspect_data['NetworkSettings'] = {
+                    'IPAddress': network.get('IPAddress', '')}
+            for name in container.get('Names') or []:
+                # docker container names include a leading '/'
+                name = name.lstrip('/')
+                if '/' not in name:
+                    self._cache_inspect(host, name, inspect_data, changes)
 
     def get_id(self, host, user, vnf_name):
         """
@@ -123,7 +406,7 @@ class DockerDriver(HypervisorBase):
           @return docker container ID.
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        return inspect_data['Id'].encode('ascii')
+        return inspect_data['Id']
 
     def get_ip(self, host, user, vnf_name):
         """
@@ -136,11 +419,15 @@ class DockerDriver(HypervisorBase):
           
           @return docker container's IP.
         """
-        if self.guest_status(host, user, vnf_name) != 'running':
-            raise errors.VNFNotRunningError
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        return inspect_data['NetworkSettings']['IPAddress'].encode('ascii')
-
+        self._ensure_running(inspect_data)
+        if 'NetworkSettings' not in inspect_data:
+            # cached from a container listing that did not carry the IP
+            dcx, inspect_data = self._lookup_vnf_fast(
+                host, vnf_fullname, refresh=True)
+        return inspect_data['NetworkSettings']['IPAddress']
+
+    @_map_errors(errors.VNFDeployError)
     def deploy(self, host, user, image_name, vnf_name, is_privileged=True):
         """
         Deploys a docker container.
@@ -158,37 +445,40 @@ class DockerDriver(HypervisorBase):
         """
         self._validate_host(host)
         self._validate_image_name(image_name)
-        vnf_fullname = user + '-' + vnf_name
+        vnf_fullname = '%s-%s' % (user, vnf_name)
         self._validate_cont_name(vnf_fullname)
         dcx = self._get_client(host)
-        host_config = dict()
-        if is_privileged:
-            host_config['Privileged'] = True
-        with self._error_handling(errors.VNFDeployError):
-            container = dcx.create_container(
-                image=image_name,
-                hostname=host,
-                name=vnf_fullname,
-                host_config=host_config)
-            return container['Id']
-
-    def start(self, host, user, vnf_name, is_privileged=True):
+        host_config = dcx.create_host_config(
+            privileged=is_privileged,
+            dns=self.__dns_list)
+        changes = self.__changes
+        container = dcx.create_container(
+            image=image_name,
+            hostname=host,
+            name=vnf_fullname,
+            host_config=host_config)
+        self._invalidate(host, vnf_fullname, changes)
+        return container['Id']
+
+    @_map_errors(errors.VNFStartError)
+    def start(self, host, user, vnf_name):
         """
         Starts a docker container.
 
+        The container's privilege mode and DNS servers are set when it is 
+        deployed.
+
         @param host IP address or hostname of the machine/VM where 
               the docker container is deployed
         @param user name of the user
         @param vnf_name name of the VNF
-        @param is_privileged if True then the container is started in 
-            privileged mode
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFStartError):
-            dcx.start(container=vnf_fullname,
-                dns=self.__dns_list,
-                privileged=is_privileged)
+        changes = self.__changes
+        dcx.start(container=vnf_fullname)
+        self._invalidate(host, vnf_fullname, changes)
 
+    @_map_errors(errors.VNFRestartError)
     def restart(self, host, user, vnf_name):
         """
         Restarts a docker container.
@@ -199,9 +489,11 @@ class DockerDriver(HypervisorBase):
         @param vnf_name name of the VNF
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFRestartError):
-            dcx.restart(container=vnf_fullname)
+        changes = self.__changes
+        dcx.restart(container=vnf_fullname)
+        self._invalidate(host, vnf_fullname, changes)
 
+    @_map_errors(errors.VNFStopError)
     def stop(self, host, user, vnf_name):
         """
         Stops a docker container.
@@ -212,9 +504,11 @@ class DockerDriver(HypervisorBase):
         @param vnf_name name of the VNF
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFStopError):
-            dcx.stop(container=vnf_fullname)
+        changes = self.__changes
+        dcx.stop(container=vnf_fullname)
+        self._invalidate(host, vnf_fullname, changes)
 
+    @_map_errors(errors.VNFPauseError)
     def pause(self, host, user, vnf_name):
         """
         Pauses a docker container.
@@ -225,9 +519,11 @@ class DockerDriver(HypervisorBase):
         @param vnf_name name of the VNF
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFPauseError):
-            dcx.pause(container=vnf_fullname)
+        changes = self.__changes
+        dcx.pause(container=vnf_fullname)
+        self._invalidate(host, vnf_fullname, changes)
 
+    @_map_errors(errors.VNFUnpauseError)
     def unpause(self, host, user, vnf_name):
         """Unpauses a docker container.
 
@@ -237,9 +533,11 @@ class DockerDriver(HypervisorBase):
         @param vnf_name name of the VNF
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFUnpauseError):
-            dcx.unpause(container=vnf_fullname)
+        changes = self.__changes
+        dcx.unpause(container=vnf_fullname)
+        self._invalidate(host, vnf_fullname, changes)
 
+    @_map_errors(errors.VNFDestroyError)
     def destroy(self, host, user, vnf_name, force=True):
         """
         Destroys a docker container.
@@ -252,10 +550,12 @@ class DockerDriver(HypervisorBase):
               be destroyed. default is True
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        with self._error_handling(errors.VNFDestroyError):
-            dcx.remove_container(container=vnf_fullname, force=force)
+        changes = self.__changes
+        dcx.remove_container(container=vnf_fullname, force=force)
+        self._invalidate(host, vnf_fullname, changes)
 
-    def execute_in_guest(self, host, user, vnf_name, cmd):
+    @_map_errors(errors.VNFCommandExecutionError)
+    def execute_in_guest(self, host, user, vnf_name, cmd, exec_stream=False):
         """
         Executed commands inside a docker container.
 
@@ -264,16 +564,17 @@ class DockerDriver(HypervisorBase):
         @param user name of the user
         @param vnf_name name of the VNF
         @param cmd the command to execute inside the container
+        @param exec_stream if True then the exec socket is returned right 
+              away instead of waiting for the command to finish
 
-        @returns The output of the command passes as cmd
+        @returns The output of the command passes as cmd, or a socket 
+              attached to the command's output if exec_stream is True
         """
         dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        if self.guest_status(host, user, vnf_name) != 'running':
-            raise errors.VNFNotRunningError
-        with self._error_handling(errors.VNFCommandExecutionError):
-            response = dcx.execute(vnf_fullname, 
-                ["/bin/bash", "-c", cmd], stdout=True, stderr=False)
-            return response
+        self._ensure_running(inspect_data)
+        exec_id = dcx.exec_create(vnf_fullname, 
+            ["/bin/bash", "-c", cmd], stdout=True, stderr=False)['Id']
+        return dcx.exec_start(exec_id, socket=exec_stream)
 
     def guest_status(self, host, user, vnf_name):
         """
@@ -284,7 +585,101 @@ class DockerDriver(HypervisorBase):
         @param user name of the user
         @param vnf_name name of the VNF
 
+        @note The first call for a host subscribes to the host's docker 
+            events. From then on, the state of a container that has seen 
+            an event is answered from the cache without querying the daemon.
+
         @returns current state of the docker container
         """
-        dcx, vnf_fullname, inspect_data = self._lookup_vnf(host, user, vnf_name)
-        return inspect_data['State']['Status'].encode('ascii')
+        self._validate_host(host)
+        vnf_fullname = '%s-%s' % (user, vnf_name)
+        self._validate_cont_name(vnf_fullname)
+        self._watch_events(host)
+        live = self.__live_states.get((host, vnf_fullname))
+        if live is not None:
+            return live[0]
+        dcx, inspect_data = self._lookup_vnf_fast(host, vnf_fullname)
+        return inspect_data['State']['Status']
+
+    def _map_vnfs(self, operation, vnf_names):
+        """
+        @brief applies operation to each VNF name using a pool of threads
+
+        The docker daemon handles concurrent requests independently, so the 
+        batch operations issue them in parallel over the host's shared 
+        connection pool rather than one after another.
+
+        @returns list of results, in the order of vnf_names
+        """
+        if not vnf_names:
+            return []
+        pool = ThreadPool(min(len(vnf_names), self.__max_workers))
+        try:
+            return pool.map(operation, vnf_names)
+        finally:
+            pool.close()
+            pool.join()
+
+    def start_many(self, host, user, vnf_names):
+        """
+        Starts several docker containers on the same host concurrently.
+
+        @param host IP address or hostname of the machine/VM where 
+              the docker containers are deployed
+        @param user name of the user
+        @param vnf_names list of VNF names
+        """
+        self._map_vnfs(
+            lambda vnf_name: self.start(host, user, vnf_name), vnf_names)
+
+    def stop_many(self, host, user, vnf_names):
+        """
+        Stops several docker containers on the same host concurrently.
+
+        @param host IP address or hostname of the machine/VM where 
+              the docker containers are deployed
+        @param user name of the user
+        @param vnf_names list of VNF names
+        """
+        self._map_vnfs(
+            lambda vnf_name: self.stop(host, user, vnf_name), vnf_names)
+
+    def destroy_many(self, host, user, vnf_names, force=True):
+        """
+        Destroys several docker containers on the same host concurrently.
+
+        @param host IP address or hostname of the machine/VM where 
+              the docker containers are deployed
+        @param user name of the user
+        @param vnf_names list of VNF names
+        @param force if set to False then running VNFs will not 
+              be destroyed. default is True
+        """
+        self._map_vnfs(
+            lambda vnf_name: self.destroy(host, user, vnf_name, force),
+            vnf_names)
+
+    def gather_guest_status(self, host, user, vnf_names):
+        """
+        Returns the status of several docker containers on the same host.
+
+        The containers are queried concurrently over the host's shared 
+        connection pool rather than one after another.
+
+        @param host IP address or hostname of the machine/VM where 
+              the docker containers are deployed
+        @param user name of the user
+        @param vnf_names list of VNF names
+
+        @returns list of container states, in the order of vnf_names
+        """
+        return self._map_vnfs(
+            lambda vnf_name: self.guest_status(host, user, vnf_name),
+            vnf_names)
+
+    def guest_status_many(self, host, user, vnf_names):
+        """
+        Same as gather_guest_status, named like the other *_many batch 
+        operations.
+        """
+        return self.gather_guest_status(host, user, vnf_names)
@@ -0,0 +1,80 @@
+"""
+@brief Pooled unix socket transport for docker-py clients.
+
+docker-py's own unix socket adapter keeps a single connection per socket, so
+concurrent API calls to a local docker daemon each open and discard a
+connection. This module provides an adapter whose connection pool can be
+sized like the TCP one.
+"""
+
+import threading
+
+from docker.unixconn.unixconn import UnixAdapter, UnixHTTPConnection
+
+try:
+    import requests.packages.urllib3 as urllib3
+except ImportError:
+    import urllib3
+
+
+class UnixHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    """
+    @class UnixHTTPConnectionPool
+    @brief urllib3 connection pool over a unix socket with a configurable
+        maximum number of kept connections.
+    """
+
+    def __init__(self, base_url, socket_path, timeout, maxsize):
+        urllib3.connectionpool.HTTPConnectionPool.__init__(
+            self, 'localhost', maxsize=maxsize)
+        self.base_url = base_url
+        self.socket_path = socket_path
+        self.socket_timeout = timeout
+
+    def _new_conn(self):
+        return UnixHTTPConnection(
+            self.base_url, self.socket_path, self.socket_timeout)
+
+
+class PooledUnixAdapter(UnixAdapter):
+    """
+    @class PooledUnixAdapter
+    @brief docker-py unix socket adapter that shares one sized connection
+        pool between all requests.
+    """
+
+    def __init__(self, socket_path, timeout, maxsize):
+        UnixAdapter.__init__(self, 'http+unix://' + socket_path, timeout)
+        self.maxsize = maxsize
+        self.unix_pool = None
+        self.unix_pool_lock = threading.Lock()
+
+    def get_connection(self, url, proxies=None):
+        # every request goes to the same socket, so one pool serves them all
+        with self.unix_pool_lock:
+            if self.unix_pool is None:
+                self.unix_pool = UnixHTTPConnectionPool(
+                    url, self.socket_path, self.timeout, self.maxsize)
+            return self.unix_pool
+
+    def close(self):
+        UnixAdapter.close(self)
+        with self.unix_pool_lock:
+            if self.unix_pool is not None:
+                self.unix_pool.close()
+                self.unix_pool = None
+
+
+def mount_pooled_unix_adapter(client, socket_path, maxsize):
+    """
+    @brief replaces the unix socket adapter of a docker-py client with a
+        PooledUnixAdapter
+
+    @param client docker client connected to a unix socket
+    @param socket_path path of the docker daemon's unix socket
+    @param maxsize number of connections kept in the pool
+    """
+    adapter = PooledUnixAdapter(socket_path, client.timeout, maxsize)
+    for prefix, mounted in list(client.adapters.items()):
+        if isinstance(mounted, UnixAdapter):
+            client.mount(prefix, adapter)
@@ -275,7 +275,12 @@ class Nfio(Operations):
                 self.module_root +
                 "." +
                 nf_type)
-            return mbox_module._read(self.root, path, length, offset, fh)
+            ret = mbox_module._read(self.root, path, length, offset, fh)
+            # hypervisor drivers return text (e.g. container status or IP), 
+            # while FUSE copies the result out as raw bytes
+            if not isinstance(ret, bytes):
+                ret = ret.encode('utf-8')
+            return ret
         os.lseek(fh, offset, os.SEEK_SET)
         return os.read(fh, length)
 